@@ -1,11 +1,29 @@
+import asyncio
+import hashlib
+import inspect
+import itertools
 import json
+import os
 import random
-import time
+import sys
 import logging
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict, deque
+from dataclasses import dataclass, fields
+from typing import List, Dict, Any, Optional, Tuple
 from colorama import Fore, Style, init
+import httpx
+import numpy as np
 import ollama
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the numpy path below is still vectorized
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson has no wheels everywhere (e.g. PyPy); stdlib works too
+    orjson = None
 
 # Initialize colorama
 init(autoreset=True)
@@ -18,116 +36,385 @@ logging.basicConfig(
 )
 logger = logging.getLogger("multi_agent_system")
 
+# Shared async client so all agents reuse one HTTP connection pool.
+# Keep-alive avoids a TCP handshake per request, and HTTP/2 (when the h2
+# extra is installed) multiplexes concurrent agents over one stream.
+# For the calls to actually overlap on the backend, set OLLAMA_NUM_PARALLEL
+# to at least the number of agents (and OLLAMA_MAX_LOADED_MODELS if the
+# agents use different models) before starting the Ollama server.
+_OLLAMA_HOST = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+_HTTPX_KWARGS: Dict[str, Any] = {
+    'timeout': httpx.Timeout(300.0, connect=10.0),
+    'limits': httpx.Limits(
+        max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0
+    ),
+}
+try:
+    _CLIENT = ollama.AsyncClient(host=_OLLAMA_HOST, http2=True, **_HTTPX_KWARGS)
+except ImportError:
+    _CLIENT = ollama.AsyncClient(host=_OLLAMA_HOST, **_HTTPX_KWARGS)
+
+# Cap in-flight chat calls to what the server will actually run in
+# parallel; anything beyond OLLAMA_NUM_PARALLEL would just queue there.
+# (Coroutines cost no thread stacks, so unlike a worker pool there is no
+# reason to also clamp this to os.cpu_count().)
+_NUM_PARALLEL = max(1, int(os.environ.get('OLLAMA_NUM_PARALLEL', 4)))
+_CHAT_SEMAPHORE = asyncio.Semaphore(_NUM_PARALLEL)
+
+# Two-tier response cache: an exact LRU on (model, system, prompt, tools)
+# plus a semantic tier matching prompt embeddings by cosine similarity.
+# Only prompts whose tools are all side-effect-free (informational) are
+# cached -- replaying a cached answer for a state-mutating tool such as
+# write_code or integrate_ai_model would skip the side effect.
+_EXACT_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_EXACT_CACHE_MAX = 1024
+# Embeddings live in one contiguous float32 (N, D) matrix of L2-normalized
+# rows (so a dot product is the cosine), with the cached messages in a
+# parallel list.
+_SEMANTIC_EMBEDDINGS: Optional[np.ndarray] = None
+_SEMANTIC_MESSAGES: List[Dict[str, Any]] = []
+_SEMANTIC_THRESHOLD = 0.92
+_EMBED_MODEL = 'nomic-embed-text'
+_CACHEABLE_TOOL_PREFIXES = ('analyze_', 'review_', 'conduct_research', 'report_')
+
+
+def _tools_key(tools: List[Dict[str, Any]]) -> str:
+    return hashlib.blake2b(
+        json.dumps(tools, sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _is_cacheable(tools: List[Dict[str, Any]]) -> bool:
+    return all(
+        tool.get('function', {}).get('name', '').startswith(_CACHEABLE_TOOL_PREFIXES)
+        for tool in tools
+    )
+
+
+if njit is not None:
+    # cache=True persists the compiled kernel across runs, so compile
+    # latency is paid once. parallel=True is deliberately left off: an
+    # argmax reduction in prange races, and single-threaded njit is
+    # already near-BLAS for a few thousand small vectors.
+    @njit(cache=True, fastmath=True)
+    def _best_match(query: np.ndarray, db: np.ndarray) -> Tuple[int, float]:
+        best_i = -1
+        best = -1.0
+        for i in range(db.shape[0]):
+            score = 0.0
+            for k in range(query.shape[0]):
+                score += query[k] * db[i, k]
+            if score > best:
+                best = score
+                best_i = i
+        return best_i, best
+else:
+    def _best_match(query: np.ndarray, db: np.ndarray) -> Tuple[int, float]:
+        scores = db @ query
+        best_i = int(np.argmax(scores))
+        return best_i, float(scores[best_i])
+
+
+async def _embed(prompt: str) -> Optional[np.ndarray]:
+    try:
+        response = await _CLIENT.embeddings(model=_EMBED_MODEL, prompt=prompt)
+        embedding = np.asarray(response.get('embedding'), dtype=np.float32)
+    except Exception as e:
+        logger.error("Error embedding prompt: %s", e)
+        return None
+    norm = float(np.linalg.norm(embedding))
+    return embedding / norm if norm else None
 
-class AIChatHistory:
-    def __init__(self, max_messages: int = 100):
-        self.messages: List[Dict[str, str]] = []
-        self.max_messages = max_messages
 
-    def add_message(self, role: str, content: str) -> None:
-        self.messages.append({"role": role, "content": content})
-        if len(self.messages) > self.max_messages:
-            self.messages.pop(0)
+def _semantic_store(embedding: np.ndarray, message: Dict[str, Any]) -> None:
+    global _SEMANTIC_EMBEDDINGS
+    row = embedding[np.newaxis, :]
+    if _SEMANTIC_EMBEDDINGS is None:
+        _SEMANTIC_EMBEDDINGS = row.copy()
+    else:
+        _SEMANTIC_EMBEDDINGS = np.vstack((_SEMANTIC_EMBEDDINGS, row))
+    _SEMANTIC_MESSAGES.append(message)
 
-    def get_context(self, last_n: int = 5) -> List[Dict[str, str]]:
-        return self.messages[-last_n:]
 
+def _semantic_lookup(embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+    if _SEMANTIC_EMBEDDINGS is None:
+        return None
+    best_i, best_score = _best_match(embedding, _SEMANTIC_EMBEDDINGS)
+    return _SEMANTIC_MESSAGES[best_i] if best_score >= _SEMANTIC_THRESHOLD else None
+
+
+# Interned copies of the constant keys and roles that flow through every
+# message dict, so the hot add_message path hashes pre-interned strings.
+_K_ROLE = sys.intern("role")
+_K_CONTENT = sys.intern("content")
+_ROLE_AGENT = sys.intern("agent")
+_ROLE_ENVIRONMENT = sys.intern("environment")
+_ROLE_SYSTEM = sys.intern("system")
+_ROLE_USER = sys.intern("user")
+
+
+class AIChatHistory:
+    def __init__(self, max_messages: int = 100):
+        # deque(maxlen=...) drops the oldest message in O(1) on append,
+        # unlike list.pop(0) which shifts every remaining element.
+        self.messages: deque = deque(maxlen=max_messages)
+        # Pre-formatted "role: content" lines kept in lockstep with
+        # messages, so prompts never re-join the whole window.
+        self._formatted: deque = deque(maxlen=max_messages)
+        self.max_messages = max_messages
 
-def generate_response(prompt: str, tools: List[Dict[str, Any]], system_message: str) -> Dict[str, Any]:
+    def add_message(self, role: str, content: Any) -> None:
+        # Content is stored as-is (dicts included); serialization happens
+        # lazily when the memory is actually displayed.
+        self.messages.append({_K_ROLE: role, _K_CONTENT: content})
+        self._formatted.append(f"{role}: {content}")
+
+    def get_context(self, last_n: int = 5) -> List[Dict[str, Any]]:
+        return list(self.messages)[-last_n:]
+
+    def get_context_str(self, last_n: int = 5) -> str:
+        start = max(0, len(self._formatted) - last_n)
+        return "\n".join(itertools.islice(self._formatted, start, None))
+
+
+async def generate_response(prompt: str, tools: List[Dict[str, Any]], system_message: str,
+                            tools_key: Optional[str] = None) -> Dict[str, Any]:
+    cacheable = _is_cacheable(tools)
+    key = None
+    embedding = None
+    if cacheable:
+        key = ('llama3.1:8b', system_message, prompt, tools_key or _tools_key(tools))
+        if key in _EXACT_CACHE:
+            _EXACT_CACHE.move_to_end(key)
+            return _EXACT_CACHE[key]
+        embedding = await _embed(prompt)
+        if embedding is not None:
+            cached = _semantic_lookup(embedding)
+            if cached is not None:
+                return cached
     try:
-        response = ollama.chat(
-            model='llama3.1:8b',
-            messages=[
-                {'role': 'system', 'content': system_message},
-                {'role': 'user', 'content': prompt}
-            ],
-            tools=tools
-        )
-        return response.get('message', {})
+        async with _CHAT_SEMAPHORE:
+            content_parts: List[str] = []
+            message: Dict[str, Any] = {}
+            stream = await _CLIENT.chat(
+                model='llama3.1:8b',
+                messages=[
+                    {_K_ROLE: _ROLE_SYSTEM, _K_CONTENT: system_message},
+                    {_K_ROLE: _ROLE_USER, _K_CONTENT: prompt}
+                ],
+                tools=tools,
+                stream=True
+            )
+            try:
+                async for chunk in stream:
+                    part = chunk.get('message', {})
+                    tool_calls = part.get('tool_calls')
+                    if tool_calls:
+                        # A tool-call turn is fully determined once the call
+                        # object arrives; don't wait out the rest of the stream.
+                        message = {'role': 'assistant', 'tool_calls': tool_calls}
+                        break
+                    content = part.get('content')
+                    if content:
+                        content_parts.append(content)
+                else:
+                    message = {'role': 'assistant', 'content': ''.join(content_parts)}
+            finally:
+                # Close the generator explicitly: breaking out of the loop
+                # would otherwise leave the underlying response to GC
+                # finalization, delaying the connection's return to the
+                # keep-alive pool.
+                await stream.aclose()
     except Exception as e:
-        logger.error(f"Error generating response: {e}")
+        logger.error("Error generating response: %s", e)
         return {}
+    if cacheable:
+        _EXACT_CACHE[key] = message
+        if len(_EXACT_CACHE) > _EXACT_CACHE_MAX:
+            _EXACT_CACHE.popitem(last=False)
+        if embedding is not None:
+            _semantic_store(embedding, message)
+    return message
+
+
+async def generate_responses_batch(requests: List[tuple]) -> List[Dict[str, Any]]:
+    """Fan out a batch of (system_message, prompt, tools, tools_key) chat requests at once."""
+    return await asyncio.gather(
+        *(generate_response(prompt, tools, system_message, tools_key)
+          for system_message, prompt, tools, tools_key in requests)
+    )
+
+
+# Action kinds, used to decide how much work a dispatch really needs:
+# CONSTANT actions populate canned state and their results are cached
+# forever, INFORMATIONAL actions are side-effect-free analyses (safe for
+# the response cache), COMMAND actions mutate state and always execute.
+CONSTANT = 'CONSTANT'
+INFORMATIONAL = 'INFORMATIONAL'
+COMMAND = 'COMMAND'
 
 
 class BaseAgent:
+    # blake2b of the tools schema, precomputed per class (or per instance
+    # where the schema is dynamic) so the cache key never re-serializes it.
+    _TOOLS_HASH: str = ''
+
+    # Known discrepancies between argument names the LLM likes to emit
+    # and the actual action signatures. Add more pairs as needed.
+    _PARAM_REMAP: Dict[str, Dict[str, str]] = {
+        'conduct_market_research': {'company_name': 'business_idea'},
+        'analyze_data': {'research_topic': 'topic'},
+        'review_code': {'existing_code': 'feature_name'},
+        'report_findings': {'message': 'findings'}
+    }
+
+    __slots__ = (
+        'name', 'specialty', 'memory', 'logger', '_action_map',
+        '_constant_results', '_remappers', '_last_ctx_hash',
+        '_last_thought', '_json_cache', '_memory_label',
+    )
+
     def __init__(self, name: str, specialty: Optional[str] = None):
         self.name = name
         self.specialty = specialty
         self.memory = AIChatHistory()
         self.logger = logging.getLogger(self.name)
+        # Built once on first use; get_action_map binds methods so it
+        # cannot be a class constant like _TOOLS / _SYSTEM_MESSAGE.
+        self._action_map: Optional[Dict[str, tuple]] = None
+        self._constant_results: Dict[str, str] = {}
+        # One precompiled remapping closure per action, so the TypeError
+        # retry path does not rebuild the mapping table every time.
+        self._remappers: Dict[str, Any] = {
+            action: (lambda params, m=mapping: {m.get(k, k): v for k, v in params.items() if k in m})
+            for action, mapping in self._PARAM_REMAP.items()
+        }
+        # Context hash + thought from the previous think, used to skip
+        # the model entirely when the context window has not moved.
+        self._last_ctx_hash: Optional[int] = None
+        self._last_thought: Optional[Dict[str, Any]] = None
+        # attr -> (fingerprint, encoded JSON), see _cached_json.
+        self._json_cache: Dict[str, tuple] = {}
+        self._memory_label = _debug_label(f"{name} Memory")
+
+    def _cached_json(self, attr: str) -> str:
+        """Serialize an attribute once per mutation epoch.
+
+        The fingerprint hashes the container's repr, so it tracks
+        content: overwriting an existing key (write_code and run_tests
+        both update entries in place) changes neither identity nor
+        length but does change the repr. The repr walk is C-speed and
+        far cheaper than re-encoding indented JSON.
+        """
+        value = getattr(self, attr)
+        if not value:
+            # Common before an agent's first action; no tree walk needed.
+            return "{}" if isinstance(value, dict) else "[]"
+        fingerprint = hash(repr(value))
+        cached = self._json_cache.get(attr)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, _dumps(value))
+            self._json_cache[attr] = cached
+        return cached[1]
+
+    def think_request(self) -> tuple:
+        return (self.get_system_message(), self.construct_prompt(), self.get_tools(),
+                self._TOOLS_HASH or None)
+
+    def _apply_thought(self, thought: Dict[str, Any]) -> None:
+        # The {} that generate_response returns on failure is not worth
+        # reusing: keeping it would pin the agent to the error sentinel
+        # for as long as the context window repeats, so a transient
+        # outage would never be retried.
+        self._last_thought = thought or None
+        self.memory.add_message(_ROLE_AGENT, thought)
+        # Guarded: stringifying a nested thought dict is not free, and
+        # %-style args defer formatting to the handler.
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Thought: %s", thought)
+
+    def shortcut_thought(self) -> Optional[Dict[str, Any]]:
+        # A CONSTANT action that has never run can be dispatched directly;
+        # no model call is needed to decide to populate canned state.
+        if self._action_map is None:
+            self._action_map = self.get_action_map()
+        for action, (_, kind) in self._action_map.items():
+            if kind == CONSTANT and action not in self._constant_results:
+                return {'tool_calls': [{'function': {'name': action, 'arguments': {}}}]}
+        # If the context window is byte-identical to the previous think,
+        # the model would see the same prompt again; reuse its answer.
+        ctx_hash = hash(self.memory.get_context_str())
+        if ctx_hash == self._last_ctx_hash and self._last_thought is not None:
+            return self._last_thought
+        self._last_ctx_hash = ctx_hash
+        return None
 
-    def think(self) -> Dict[str, Any]:
-        context = self.memory.get_context()
-        prompt = self.construct_prompt(context)
-        tools = self.get_tools()
-        system_message = self.get_system_message()
-        thought = generate_response(prompt, tools, system_message)
-        self.memory.add_message("agent", json.dumps(thought))
-        self.logger.info(f"Thought: {thought}")
+    async def think(self) -> Dict[str, Any]:
+        thought = self.shortcut_thought()
+        if thought is None:
+            system_message, prompt, tools, tools_key = self.think_request()
+            thought = await generate_response(prompt, tools, system_message, tools_key)
+        self._apply_thought(thought)
         return thought
 
-    def act(self, action: Dict[str, Any]) -> Any:
+    async def act(self, action: Dict[str, Any]) -> Any:
         if 'tool_calls' in action:
             tool_call = action['tool_calls'][0].get('function', {})
-            result = self.execute_action(tool_call.get('name', ''), tool_call.get('arguments', {}))
+            name = tool_call.get('name', '')
+            try:
+                result = await self.execute_action(name, tool_call.get('arguments', {}))
+            except TypeError as te:
+                # Off-schema arguments even after remapping; feed the error
+                # back into memory so the agent can adjust. Anything else
+                # propagates to the run() boundary and is logged once there.
+                self.logger.error("Error executing action '%s': %s", name, te)
+                result = f"Error executing action '{name}': {te}"
         else:
             result = f"No actionable instruction found in: {action.get('content', '')}"
-        self.memory.add_message("environment", f"Action result: {result}")
-        self.logger.info(f"Action result: {result}")
+        self.memory.add_message(_ROLE_ENVIRONMENT, f"Action result: {result}")
+        self.logger.info("Action result: %s", result)
         return result
 
-    def execute_action(self, action: str, params: Dict[str, Any]) -> str:
-        action_map = self.get_action_map()
-        action_func = action_map.get(action)
-        if action_func:
+    async def execute_action(self, action: str, params: Dict[str, Any]) -> str:
+        if self._action_map is None:
+            self._action_map = self.get_action_map()
+        entry = self._action_map.get(action)
+        if entry:
+            action_func, kind = entry
+            if kind == CONSTANT and action in self._constant_results:
+                return self._constant_results[action]
             try:
-                return action_func(**params)
-            except TypeError as te:
-                # Attempt to map unexpected arguments to expected ones
-                mapped_params = self.map_parameters(action, params)
-                if mapped_params:
-                    try:
-                        return action_func(**mapped_params)
-                    except Exception as e:
-                        self.logger.error(f"Error executing action '{action}' after mapping: {e}")
-                        return f"Error executing action '{action}': {e}"
-                self.logger.error(f"Error executing action '{action}': {te}")
-                return f"Error executing action '{action}': {te}"
-            except Exception as e:
-                self.logger.error(f"Unexpected error executing action '{action}': {e}")
-                return f"Unexpected error executing action '{action}': {e}"
+                result = action_func(**params)
+            except TypeError:
+                # Attempt to map unexpected arguments to expected ones;
+                # a second TypeError propagates to the caller.
+                remapper = self._remappers.get(action)
+                if remapper is None:
+                    raise
+                result = action_func(**remapper(params))
+            if inspect.isawaitable(result):
+                result = await result
+            if kind == CONSTANT:
+                self._constant_results[action] = result
+            return result
         return f"Unknown action: {action}"
 
-    def map_parameters(self, action: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        # Define mappings for known discrepancies
-        mappings = {
-            'conduct_market_research': {'company_name': 'business_idea'},
-            'analyze_data': {'research_topic': 'topic'},
-            'review_code': {'existing_code': 'feature_name'},
-            'report_findings': {'message': 'findings'}
-            # Add more mappings as needed
-        }
-        if action in mappings:
-            expected_params = mappings[action]
-            mapped = {expected_params.get(k, k): v for k, v in params.items() if k in expected_params}
-            if mapped:
-                return mapped
-        return None
-
-    def learn(self, experience: Dict[str, Any]) -> None:
-        self.memory.add_message("experience", json.dumps(experience))
-        self.logger.info("Learned from experience.")
-
-    def run(self, max_iterations: int = 10) -> None:
+    async def step(self) -> None:
+        # One fused think -> act iteration. Memory already receives the
+        # thought and the action result, so no separate experience record
+        # (and its extra dict and log line) is kept.
+        thought = await self.think()
+        await self.act(thought)
+        # Tiny jitter to desynchronize agents; throughput is governed by
+        # the chat semaphore, not by sleeping.
+        await asyncio.sleep(random.uniform(0, 0.1))
+
+    async def run(self, max_iterations: int = 10) -> None:
         for i in range(max_iterations):
-            self.logger.info(f"Iteration {i + 1}/{max_iterations}")
-            thought = self.think()
-            action = self.act(thought)
-            experience = {"thought": thought, "action": action}
-            self.learn(experience)
-            time.sleep(random.uniform(0.5, 2.0))
-
-    def construct_prompt(self, context: List[Dict[str, str]]) -> str:
+            self.logger.info("Iteration %d/%d", i + 1, max_iterations)
+            await self.step()
+
+    def construct_prompt(self) -> str:
         raise NotImplementedError
 
     def get_tools(self) -> List[Dict[str, Any]]:
@@ -136,11 +423,67 @@ class BaseAgent:
     def get_system_message(self) -> str:
         raise NotImplementedError
 
-    def get_action_map(self) -> Dict[str, Any]:
+    def get_action_map(self) -> Dict[str, tuple]:
         raise NotImplementedError
 
 
 class EntrepreneurAgent(BaseAgent):
+    _TOOLS: List[Dict[str, Any]] = [
+        {
+            'type': 'function',
+            'function': {
+                'name': 'develop_business_plan',
+                'description': 'Develop or update the business plan',
+                'parameters': {}
+            }
+        },
+        {
+            'type': 'function',
+            'function': {
+                'name': 'conduct_market_research',
+                'description': 'Conduct or update market research',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'business_idea': {'type': 'string'}
+                    },
+                    'required': ['business_idea']
+                }
+            }
+        },
+        {
+            'type': 'function',
+            'function': {
+                'name': 'create_financial_projections',
+                'description': 'Create or update financial projections',
+                'parameters': {}
+            }
+        },
+        {
+            'type': 'function',
+            'function': {
+                'name': 'plan_product_development',
+                'description': 'Plan or update product development strategy',
+                'parameters': {}
+            }
+        },
+        {
+            'type': 'function',
+            'function': {
+                'name': 'design_marketing_strategy',
+                'description': 'Design or update marketing strategy',
+                'parameters': {}
+            }
+        }
+    ]
+    _SYSTEM_MESSAGE = "You are an experienced entrepreneur focused on developing innovative business ideas."
+    _TOOLS_HASH = _tools_key(_TOOLS)
+
+    __slots__ = (
+        'business_idea', 'business_plan', 'market_research',
+        'financial_projections', 'product_development', 'marketing_strategy',
+    )
+
     def __init__(self, name: str, business_idea: str):
         super().__init__(name, specialty="Entrepreneurship")
         self.business_idea = business_idea
@@ -150,8 +493,8 @@ class EntrepreneurAgent(BaseAgent):
         self.product_development: Dict[str, Any] = {}
         self.marketing_strategy: Dict[str, Any] = {}
 
-    def construct_prompt(self, context: List[Dict[str, str]]) -> str:
-        context_str = "\n".join([f"{msg['role']}: {msg['content']}" for msg in context])
+    def construct_prompt(self) -> str:
+        context_str = self.memory.get_context_str()
         return (
             f"As an entrepreneur with the business idea: {self.business_idea}\n"
             f"Given the context:\n{context_str}\n"
@@ -159,65 +502,18 @@ class EntrepreneurAgent(BaseAgent):
         )
 
     def get_tools(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'develop_business_plan',
-                    'description': 'Develop or update the business plan',
-                    'parameters': {}
-                }
-            },
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'conduct_market_research',
-                    'description': 'Conduct or update market research',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'business_idea': {'type': 'string'}
-                        },
-                        'required': ['business_idea']
-                    }
-                }
-            },
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'create_financial_projections',
-                    'description': 'Create or update financial projections',
-                    'parameters': {}
-                }
-            },
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'plan_product_development',
-                    'description': 'Plan or update product development strategy',
-                    'parameters': {}
-                }
-            },
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'design_marketing_strategy',
-                    'description': 'Design or update marketing strategy',
-                    'parameters': {}
-                }
-            }
-        ]
+        return self._TOOLS
 
     def get_system_message(self) -> str:
-        return "You are an experienced entrepreneur focused on developing innovative business ideas."
+        return self._SYSTEM_MESSAGE
 
-    def get_action_map(self) -> Dict[str, Any]:
+    def get_action_map(self) -> Dict[str, tuple]:
         return {
-            'develop_business_plan': self.develop_business_plan,
-            'conduct_market_research': self.conduct_market_research,
-            'create_financial_projections': self.create_financial_projections,
-            'plan_product_development': self.plan_product_development,
-            'design_marketing_strategy': self.design_marketing_strategy
+            'develop_business_plan': (self.develop_business_plan, CONSTANT),
+            'conduct_market_research': (self.conduct_market_research, COMMAND),
+            'create_financial_projections': (self.create_financial_projections, CONSTANT),
+            'plan_product_development': (self.plan_product_development, CONSTANT),
+            'design_marketing_strategy': (self.design_marketing_strategy, CONSTANT)
         }
 
     def develop_business_plan(self) -> str:
@@ -284,88 +580,94 @@ class EntrepreneurAgent(BaseAgent):
 
 
 class DeveloperAgent(BaseAgent):
+    _TOOLS: List[Dict[str, Any]] = [
+        {
+            'type': 'function',
+            'function': {
+                'name': 'write_code',
+                'description': 'Write or update code for a specific feature',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'feature_name': {'type': 'string'},
+                        'code': {'type': 'string'}
+                    },
+                    'required': ['feature_name', 'code']
+                }
+            }
+        },
+        {
+            'type': 'function',
+            'function': {
+                'name': 'review_code',
+                'description': 'Review and suggest improvements for existing code',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'feature_name': {'type': 'string'}
+                    },
+                    'required': ['feature_name']
+                }
+            }
+        },
+        {
+            'type': 'function',
+            'function': {
+                'name': 'integrate_ai_model',
+                'description': 'Integrate an AI model into the application',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'model_name': {'type': 'string'},
+                        'integration_code': {'type': 'string'}
+                    },
+                    'required': ['model_name', 'integration_code']
+                }
+            }
+        }
+    ]
+    _SYSTEM_MESSAGE = "You are an expert developer specializing in AI-powered applications."
+    _TOOLS_HASH = _tools_key(_TOOLS)
+
+    __slots__ = ('codebase',)
+
     def __init__(self, name: str):
         super().__init__(name, specialty="Development")
         self.codebase: Dict[str, str] = {}
 
-    def construct_prompt(self, context: List[Dict[str, str]]) -> str:
-        context_str = "\n".join([f"{msg['role']}: {msg['content']}" for msg in context])
+    def construct_prompt(self) -> str:
+        context_str = self.memory.get_context_str()
         return (
             f"As a developer, given the context:\n{context_str}\n"
             f"What should I focus on next in the development process?"
         )
 
     def get_tools(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'write_code',
-                    'description': 'Write or update code for a specific feature',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'feature_name': {'type': 'string'},
-                            'code': {'type': 'string'}
-                        },
-                        'required': ['feature_name', 'code']
-                    }
-                }
-            },
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'review_code',
-                    'description': 'Review and suggest improvements for existing code',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'feature_name': {'type': 'string'}
-                        },
-                        'required': ['feature_name']
-                    }
-                }
-            },
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'integrate_ai_model',
-                    'description': 'Integrate an AI model into the application',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'model_name': {'type': 'string'},
-                            'integration_code': {'type': 'string'}
-                        },
-                        'required': ['model_name', 'integration_code']
-                    }
-                }
-            }
-        ]
+        return self._TOOLS
 
     def get_system_message(self) -> str:
-        return "You are an expert developer specializing in AI-powered applications."
+        return self._SYSTEM_MESSAGE
 
-    def get_action_map(self) -> Dict[str, Any]:
+    def get_action_map(self) -> Dict[str, tuple]:
         return {
-            'write_code': self.write_code,
-            'review_code': self.review_code,
-            'integrate_ai_model': self.integrate_ai_model
+            'write_code': (self.write_code, COMMAND),
+            'review_code': (self.review_code, INFORMATIONAL),
+            'integrate_ai_model': (self.integrate_ai_model, COMMAND)
         }
 
     def write_code(self, feature_name: str, code: str) -> str:
         self.codebase[feature_name] = code
         return f"Code written for {feature_name}."
 
-    def review_code(self, feature_name: str) -> str:
+    async def review_code(self, feature_name: str) -> str:
         code = self.codebase.get(feature_name, "")
         if not code:
             return f"No code found for feature: {feature_name}."
-        review = generate_response(
+        review = (await generate_response(
             f"Review the following code for {feature_name}:\n{code}",
             [],
             ""
-        ).get('content', '')
+        )).get('content', '')
         return f"Code review for {feature_name}: {review}"
 
     def integrate_ai_model(self, model_name: str, integration_code: str) -> str:
@@ -374,95 +676,104 @@ class DeveloperAgent(BaseAgent):
 
 
 class TesterAgent(BaseAgent):
-    def __init__(self, name: str):
+    """Runs tests against the developer agent's codebase."""
+
+    _TOOLS: List[Dict[str, Any]] = [
+        {
+            'type': 'function',
+            'function': {
+                'name': 'run_tests',
+                'description': 'Run tests for a specific feature',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'feature_name': {'type': 'string'}
+                    },
+                    'required': ['feature_name']
+                }
+            }
+        },
+        {
+            'type': 'function',
+            'function': {
+                'name': 'analyze_test_results',
+                'description': 'Analyze and interpret test results',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'feature_name': {'type': 'string'}
+                    },
+                    'required': ['feature_name']
+                }
+            }
+        },
+        {
+            'type': 'function',
+            'function': {
+                'name': 'report_bugs',
+                'description': 'Report bugs or issues found during testing',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'feature_name': {'type': 'string'},
+                        'bug_description': {'type': 'string'}
+                    },
+                    'required': ['feature_name', 'bug_description']
+                }
+            }
+        }
+    ]
+    _SYSTEM_MESSAGE = "You are an experienced tester specializing in software quality assurance."
+    _TOOLS_HASH = _tools_key(_TOOLS)
+
+    __slots__ = ('developer', 'test_results')
+
+    def __init__(self, name: str, developer: DeveloperAgent):
         super().__init__(name, specialty="Testing")
+        self.developer = developer
         self.test_results: Dict[str, str] = {}
 
-    def construct_prompt(self, context: List[Dict[str, str]]) -> str:
-        context_str = "\n".join([f"{msg['role']}: {msg['content']}" for msg in context])
+    def construct_prompt(self) -> str:
+        context_str = self.memory.get_context_str()
         return (
             f"As a tester, given the context:\n{context_str}\n"
             f"What should I focus on next in the testing process?"
         )
 
     def get_tools(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'run_tests',
-                    'description': 'Run tests for a specific feature',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'feature_name': {'type': 'string'}
-                        },
-                        'required': ['feature_name']
-                    }
-                }
-            },
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'analyze_test_results',
-                    'description': 'Analyze and interpret test results',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'feature_name': {'type': 'string'}
-                        },
-                        'required': ['feature_name']
-                    }
-                }
-            },
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'report_bugs',
-                    'description': 'Report bugs or issues found during testing',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'feature_name': {'type': 'string'},
-                            'bug_description': {'type': 'string'}
-                        },
-                        'required': ['feature_name', 'bug_description']
-                    }
-                }
-            }
-        ]
+        return self._TOOLS
 
     def get_system_message(self) -> str:
-        return "You are an experienced tester specializing in software quality assurance."
+        return self._SYSTEM_MESSAGE
 
-    def get_action_map(self) -> Dict[str, Any]:
+    def get_action_map(self) -> Dict[str, tuple]:
         return {
-            'run_tests': self.run_tests,
-            'analyze_test_results': self.analyze_test_results,
-            'report_bugs': self.report_bugs
+            'run_tests': (self.run_tests, COMMAND),
+            'analyze_test_results': (self.analyze_test_results, INFORMATIONAL),
+            'report_bugs': (self.report_bugs, INFORMATIONAL)
         }
 
-    def run_tests(self, feature_name: str) -> str:
-        code = developer.codebase.get(feature_name, "")
+    async def run_tests(self, feature_name: str) -> str:
+        code = self.developer.codebase.get(feature_name, "")
         if not code:
             return f"No code available for feature: {feature_name}."
-        test_result = generate_response(
+        test_result = (await generate_response(
             f"Run tests for the feature '{feature_name}' with the following code:\n{code}",
             [],
             ""
-        ).get('content', '')
+        )).get('content', '')
         self.test_results[feature_name] = test_result
         return f"Tests for {feature_name} completed successfully."
 
-    def analyze_test_results(self, feature_name: str) -> str:
+    async def analyze_test_results(self, feature_name: str) -> str:
         result = self.test_results.get(feature_name, "")
         if not result:
             return f"No test results found for feature: {feature_name}."
-        analysis = generate_response(
+        analysis = (await generate_response(
             f"Analyze the following test results for {feature_name}:\n{result}",
             [],
             ""
-        ).get('content', '')
+        )).get('content', '')
         return f"Test results for '{feature_name}': {analysis}"
 
     def report_bugs(self, feature_name: str, bug_description: str) -> str:
@@ -470,92 +781,98 @@ class TesterAgent(BaseAgent):
 
 
 class ResearchAgent(BaseAgent):
+    _TOOLS: List[Dict[str, Any]] = [
+        {
+            'type': 'function',
+            'function': {
+                'name': 'conduct_research',
+                'description': 'Conduct research on a specific topic',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'topic': {'type': 'string'}
+                    },
+                    'required': ['topic']
+                }
+            }
+        },
+        {
+            'type': 'function',
+            'function': {
+                'name': 'analyze_data',
+                'description': 'Analyze and interpret research data',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'topic': {'type': 'string'}
+                    },
+                    'required': ['topic']
+                }
+            }
+        },
+        {
+            'type': 'function',
+            'function': {
+                'name': 'report_findings',
+                'description': 'Report findings from research',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'topic': {'type': 'string'},
+                        'findings': {'type': 'string'}
+                    },
+                    'required': ['topic', 'findings']
+                }
+            }
+        }
+    ]
+    _SYSTEM_MESSAGE = "You are an experienced researcher specializing in data analysis and interpretation."
+    _TOOLS_HASH = _tools_key(_TOOLS)
+
+    __slots__ = ('research_data',)
+
     def __init__(self, name: str):
         super().__init__(name, specialty="Research")
         self.research_data: Dict[str, str] = {}
 
-    def construct_prompt(self, context: List[Dict[str, str]]) -> str:
-        context_str = "\n".join([f"{msg['role']}: {msg['content']}" for msg in context])
+    def construct_prompt(self) -> str:
+        context_str = self.memory.get_context_str()
         return (
             f"As a researcher, given the context:\n{context_str}\n"
             f"What should I focus on next in the research process?"
         )
 
     def get_tools(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'conduct_research',
-                    'description': 'Conduct research on a specific topic',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'topic': {'type': 'string'}
-                        },
-                        'required': ['topic']
-                    }
-                }
-            },
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'analyze_data',
-                    'description': 'Analyze and interpret research data',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'topic': {'type': 'string'}
-                        },
-                        'required': ['topic']
-                    }
-                }
-            },
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'report_findings',
-                    'description': 'Report findings from research',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'topic': {'type': 'string'},
-                            'findings': {'type': 'string'}
-                        },
-                        'required': ['topic', 'findings']
-                    }
-                }
-            }
-        ]
+        return self._TOOLS
 
     def get_system_message(self) -> str:
-        return "You are an experienced researcher specializing in data analysis and interpretation."
+        return self._SYSTEM_MESSAGE
 
-    def get_action_map(self) -> Dict[str, Any]:
+    def get_action_map(self) -> Dict[str, tuple]:
         return {
-            'conduct_research': self.conduct_research,
-            'analyze_data': self.analyze_data,
-            'report_findings': self.report_findings
+            'conduct_research': (self.conduct_research, INFORMATIONAL),
+            'analyze_data': (self.analyze_data, INFORMATIONAL),
+            'report_findings': (self.report_findings, INFORMATIONAL)
         }
 
-    def conduct_research(self, topic: str) -> str:
-        research = generate_response(
+    async def conduct_research(self, topic: str) -> str:
+        research = (await generate_response(
             f"Conduct comprehensive research on the topic: {topic}.",
             [],
             ""
-        ).get('content', '')
+        )).get('content', '')
         self.research_data[topic] = research
         return f"Research on '{topic}' completed successfully."
 
-    def analyze_data(self, topic: str) -> str:
+    async def analyze_data(self, topic: str) -> str:
         data = self.research_data.get(topic, "")
         if not data:
             return f"No research data found for topic: {topic}."
-        analysis = generate_response(
+        analysis = (await generate_response(
             f"Analyze the following research data on {topic}:\n{data}",
             [],
             ""
-        ).get('content', '')
+        )).get('content', '')
         return f"Data analysis for '{topic}': {analysis}"
 
     def report_findings(self, topic: str, findings: str) -> str:
@@ -563,24 +880,19 @@ class ResearchAgent(BaseAgent):
 
 
 class CustomSpecialistAgent(BaseAgent):
+    __slots__ = ('specialist_data', '_tools', '_system_message', '_TOOLS_HASH')
+
     def __init__(self, name: str, specialty: str):
         super().__init__(name, specialty=specialty)
         self.specialist_data: Dict[str, str] = {}
-
-    def construct_prompt(self, context: List[Dict[str, str]]) -> str:
-        context_str = "\n".join([f"{msg['role']}: {msg['content']}" for msg in context])
-        return (
-            f"As a {self.specialty} specialist, given the context:\n{context_str}\n"
-            f"What should I focus on next in my work?"
-        )
-
-    def get_tools(self) -> List[Dict[str, Any]]:
-        return [
+        # Tools and system message interpolate the specialty, so they are
+        # built once per instance rather than shared at class level.
+        self._tools: List[Dict[str, Any]] = [
             {
                 'type': 'function',
                 'function': {
                     'name': 'perform_task',
-                    'description': f'Perform a task related to {self.specialty}',
+                    'description': f'Perform a task related to {specialty}',
                     'parameters': {
                         'type': 'object',
                         'properties': {
@@ -594,7 +906,7 @@ class CustomSpecialistAgent(BaseAgent):
                 'type': 'function',
                 'function': {
                     'name': 'analyze_results',
-                    'description': f'Analyze and interpret results of {self.specialty} tasks',
+                    'description': f'Analyze and interpret results of {specialty} tasks',
                     'parameters': {
                         'type': 'object',
                         'properties': {
@@ -608,7 +920,7 @@ class CustomSpecialistAgent(BaseAgent):
                 'type': 'function',
                 'function': {
                     'name': 'report_findings',
-                    'description': f'Report findings from {self.specialty} tasks',
+                    'description': f'Report findings from {specialty} tasks',
                     'parameters': {
                         'type': 'object',
                         'properties': {
@@ -619,172 +931,346 @@ class CustomSpecialistAgent(BaseAgent):
                 }
             }
         ]
+        self._system_message = f"You are an experienced {specialty} specialist."
+        self._TOOLS_HASH = _tools_key(self._tools)
+
+    def construct_prompt(self) -> str:
+        context_str = self.memory.get_context_str()
+        return (
+            f"As a {self.specialty} specialist, given the context:\n{context_str}\n"
+            f"What should I focus on next in my work?"
+        )
+
+    def get_tools(self) -> List[Dict[str, Any]]:
+        return self._tools
 
     def get_system_message(self) -> str:
-        return f"You are an experienced {self.specialty} specialist."
+        return self._system_message
 
-    def get_action_map(self) -> Dict[str, Any]:
+    def get_action_map(self) -> Dict[str, tuple]:
         return {
-            'perform_task': self.perform_task,
-            'analyze_results': self.analyze_results,
-            'report_findings': self.report_findings
+            'perform_task': (self.perform_task, COMMAND),
+            'analyze_results': (self.analyze_results, INFORMATIONAL),
+            'report_findings': (self.report_findings, INFORMATIONAL)
         }
 
-    def perform_task(self, task: str) -> str:
-        result = generate_response(
+    async def perform_task(self, task: str) -> str:
+        result = (await generate_response(
             f"Perform the following {self.specialty} task: {task}.",
             [],
             ""
-        ).get('content', '')
+        )).get('content', '')
         self.specialist_data[task] = result
         return f"{self.specialty} task '{task}' completed successfully."
 
-    def analyze_results(self, task: str) -> str:
+    async def analyze_results(self, task: str) -> str:
         data = self.specialist_data.get(task, "")
         if not data:
             return f"No data found for {self.specialty} task: {task}."
-        analysis = generate_response(
+        analysis = (await generate_response(
             f"Analyze the results of the {self.specialty} task '{task}':\n{data}",
             [],
             ""
-        ).get('content', '')
+        )).get('content', '')
         return f"Results analysis for {self.specialty} task '{task}': {analysis}"
 
-    def report_findings(self, task: str) -> str:
+    async def report_findings(self, task: str) -> str:
         data = self.specialist_data.get(task, "")
         if not data:
             return f"No data to report for {self.specialty} task: {task}."
-        findings = generate_response(
+        findings = (await generate_response(
             f"Summarize and report the findings from the {self.specialty} task '{task}':\n{data}",
             [],
             ""
-        ).get('content', '')
+        )).get('content', '')
         return f"Findings reported for {self.specialty} task '{task}': {findings}"
 
 
 class PeerReviewAgent(BaseAgent):
+    _TOOLS: List[Dict[str, Any]] = [
+        {
+            'type': 'function',
+            'function': {
+                'name': 'review_work',
+                'description': 'Review work from another agent',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'agent_name': {'type': 'string'},
+                        'work': {'type': 'string'}
+                    },
+                    'required': ['agent_name', 'work']
+                }
+            }
+        },
+        {
+            'type': 'function',
+            'function': {
+                'name': 'provide_feedback',
+                'description': 'Provide feedback on reviewed work',
+                'parameters': {
+                    'type': 'object',
+                    'properties': {
+                        'agent_name': {'type': 'string'},
+                        'feedback': {'type': 'string'}
+                    },
+                    'required': ['agent_name', 'feedback']
+                }
+            }
+        }
+    ]
+    _SYSTEM_MESSAGE = "You are an experienced peer reviewer specializing in providing constructive feedback."
+    _TOOLS_HASH = _tools_key(_TOOLS)
+
+    __slots__ = ('review_data',)
+
     def __init__(self, name: str):
         super().__init__(name, specialty="Peer Review")
         self.review_data: Dict[str, str] = {}
 
-    def construct_prompt(self, context: List[Dict[str, str]]) -> str:
-        context_str = "\n".join([f"{msg['role']}: {msg['content']}" for msg in context])
+    def construct_prompt(self) -> str:
+        context_str = self.memory.get_context_str()
         return (
             f"As a peer reviewer, given the context:\n{context_str}\n"
             f"What should I focus on next in the review process?"
         )
 
     def get_tools(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'review_work',
-                    'description': 'Review work from another agent',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'agent_name': {'type': 'string'},
-                            'work': {'type': 'string'}
-                        },
-                        'required': ['agent_name', 'work']
-                    }
-                }
-            },
-            {
-                'type': 'function',
-                'function': {
-                    'name': 'provide_feedback',
-                    'description': 'Provide feedback on reviewed work',
-                    'parameters': {
-                        'type': 'object',
-                        'properties': {
-                            'agent_name': {'type': 'string'},
-                            'feedback': {'type': 'string'}
-                        },
-                        'required': ['agent_name', 'feedback']
-                    }
-                }
-            }
-        ]
+        return self._TOOLS
 
     def get_system_message(self) -> str:
-        return "You are an experienced peer reviewer specializing in providing constructive feedback."
+        return self._SYSTEM_MESSAGE
 
-    def get_action_map(self) -> Dict[str, Any]:
+    def get_action_map(self) -> Dict[str, tuple]:
         return {
-            'review_work': self.review_work,
-            'provide_feedback': self.provide_feedback
+            'review_work': (self.review_work, INFORMATIONAL),
+            'provide_feedback': (self.provide_feedback, INFORMATIONAL)
         }
 
-    def review_work(self, agent_name: str, work: str) -> str:
+    async def review_work(self, agent_name: str, work: str) -> str:
         self.review_data[agent_name] = work
-        review = generate_response(
+        review = (await generate_response(
             f"Review the following work from {agent_name}:\n{work}",
             [],
             ""
-        ).get('content', '')
+        )).get('content', '')
         return f"Work from {agent_name} reviewed successfully."
 
     def provide_feedback(self, agent_name: str, feedback: str) -> str:
         return f"Feedback provided for '{agent_name}': {feedback}."
 
 
-def display_agent_data(*agents: BaseAgent) -> None:
-    for agent in agents:
-        print(f"{Fore.RED}[DEBUG] {agent.name} Memory:{Style.RESET_ALL}")
-        print(json.dumps(agent.memory.messages, indent=2))
-        if isinstance(agent, EntrepreneurAgent):
-            print(f"{Fore.RED}[DEBUG] Business Plan:{Style.RESET_ALL}")
-            print(json.dumps(agent.business_plan, indent=2))
-            print(f"{Fore.RED}[DEBUG] Market Research:{Style.RESET_ALL}")
-            print(json.dumps(agent.market_research, indent=2))
-            print(f"{Fore.RED}[DEBUG] Financial Projections:{Style.RESET_ALL}")
-            print(json.dumps(agent.financial_projections, indent=2))
-            print(f"{Fore.RED}[DEBUG] Product Development:{Style.RESET_ALL}")
-            print(json.dumps(agent.product_development, indent=2))
-            print(f"{Fore.RED}[DEBUG] Marketing Strategy:{Style.RESET_ALL}")
-            print(json.dumps(agent.marketing_strategy, indent=2))
-        elif isinstance(agent, DeveloperAgent):
-            print(f"{Fore.RED}[DEBUG] Developer Agent Codebase:{Style.RESET_ALL}")
-            print(json.dumps(agent.codebase, indent=2))
-        elif isinstance(agent, TesterAgent):
-            print(f"{Fore.RED}[DEBUG] Tester Agent Test Results:{Style.RESET_ALL}")
-            print(json.dumps(agent.test_results, indent=2))
-        elif isinstance(agent, ResearchAgent):
-            print(f"{Fore.RED}[DEBUG] Research Agent Research Data:{Style.RESET_ALL}")
-            print(json.dumps(agent.research_data, indent=2))
-        elif isinstance(agent, CustomSpecialistAgent):
-            print(f"{Fore.RED}[DEBUG] Custom Specialist Agent Data:{Style.RESET_ALL}")
-            print(json.dumps(agent.specialist_data, indent=2))
-        elif isinstance(agent, PeerReviewAgent):
-            print(f"{Fore.RED}[DEBUG] Peer Reviewer Agent Review Data:{Style.RESET_ALL}")
-            print(json.dumps(agent.review_data, indent=2))
-        print("\n")
+# Indentation is for humans at a terminal; piped output (log aggregators,
+# files) gets compact JSON, which halves the bytes and skips the
+# encoder's indent handling entirely.
+_PRETTY = sys.stdout.isatty()
+
+
+def _dumps(obj: Any) -> str:
+    """Encode obj as JSON, preferring orjson's Rust encoder."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _PRETTY else 0)
+        return orjson.dumps(obj, option=option, default=str).decode()
+    if _PRETTY:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(',', ':'), default=str)
+
+
+async def run_all(agents: List[BaseAgent], max_iterations: int = 10) -> None:
+    """Run all agents round by round, batching their LLM calls per round."""
+    for i in range(max_iterations):
+        logger.info("Round %d/%d", i + 1, max_iterations)
+        thoughts: List[Optional[Dict[str, Any]]] = [agent.shortcut_thought() for agent in agents]
+        pending = [(idx, agent) for idx, agent in enumerate(agents) if thoughts[idx] is None]
+        requests = [agent.think_request() for _, agent in pending]
+        responses = await generate_responses_batch(requests)
+        for (idx, _), response in zip(pending, responses):
+            thoughts[idx] = response
+        for agent, thought in zip(agents, thoughts):
+            agent._apply_thought(thought)
+
+        # Actions are independent across agents and mostly LLM sub-calls
+        # (review_code, run_tests, conduct_research, ...), so they overlap
+        # the same way the think batch does. Results come back in submit
+        # order, so pairing them with agents is a zip -- no reverse lookup
+        # -- and one agent's failure is logged in place without aborting
+        # the round for the others.
+        results = await asyncio.gather(
+            *(agent.act(thought) for agent, thought in zip(agents, thoughts)),
+            return_exceptions=True
+        )
+        for agent, result in zip(agents, results):
+            if isinstance(result, BaseException):
+                logger.error("%s generated an exception: %s", agent.name, result)
+        await asyncio.sleep(random.uniform(0, 0.1))
+
+
+def _debug_label(label: str) -> str:
+    return f"{Fore.RED}[DEBUG] {label}:{Style.RESET_ALL}\n"
+
+
+# (header, attribute) pairs per agent type, with the colored header built
+# once at import instead of re-formatting ANSI escapes on every dump;
+# attributes are encoded through BaseAgent._cached_json so repeated dumps
+# reuse the serialized bytes. Exact-type dispatch replaces the isinstance
+# if/elif chain; the MRO walk below covers subclasses of the known types.
+_DUMP_SECTIONS: Dict[type, tuple] = {
+    EntrepreneurAgent: (
+        (_debug_label("Business Plan"), "business_plan"),
+        (_debug_label("Market Research"), "market_research"),
+        (_debug_label("Financial Projections"), "financial_projections"),
+        (_debug_label("Product Development"), "product_development"),
+        (_debug_label("Marketing Strategy"), "marketing_strategy"),
+    ),
+    DeveloperAgent: ((_debug_label("Developer Agent Codebase"), "codebase"),),
+    TesterAgent: ((_debug_label("Tester Agent Test Results"), "test_results"),),
+    ResearchAgent: ((_debug_label("Research Agent Research Data"), "research_data"),),
+    CustomSpecialistAgent: ((_debug_label("Custom Specialist Agent Data"), "specialist_data"),),
+    PeerReviewAgent: ((_debug_label("Peer Reviewer Agent Review Data"), "review_data"),),
+}
+
+
+def _agent_sections(agent: BaseAgent) -> tuple:
+    sections = _DUMP_SECTIONS.get(type(agent))
+    if sections is None:
+        for cls in type(agent).__mro__:
+            if cls in _DUMP_SECTIONS:
+                return _DUMP_SECTIONS[cls]
+        return ()
+    return sections
+
+
+def _build_formatters() -> Dict[type, Any]:
+    """Generate one specialized report formatter per agent type.
+
+    Each formatter is exec'd from a template that inlines the section
+    headers as default arguments and the attribute names as string
+    literals, so formatting an agent is straight-line code with no
+    section loop, no MRO walk and no per-call dict lookups.
+    """
+    formatters: Dict[type, Any] = {}
+    for cls, sections in _DUMP_SECTIONS.items():
+        name = f"_fmt_{cls.__name__}"
+        params = ["a", "_dumps=_dumps"]
+        body = ["    parts = [a._memory_label, _dumps(list(a.memory.messages)), '\\n']"]
+        for i, (header, attr) in enumerate(sections):
+            params.append(f"_h{i}=_headers[{i}]")
+            body.append(f"    parts.append(_h{i})")
+            body.append(f"    parts.append(a._cached_json({attr!r}))")
+            body.append("    parts.append('\\n')")
+        body.append("    parts.append('\\n\\n')")
+        body.append("    return ''.join(parts).encode()")
+        source = "def {}({}):\n{}".format(name, ", ".join(params), "\n".join(body))
+        namespace = {'_dumps': _dumps, '_headers': [header for header, _ in sections]}
+        exec(source, namespace)
+        formatters[cls] = namespace[name]
+    return formatters
+
+
+_FORMATTERS = _build_formatters()
+
+
+def _agent_report(agent: BaseAgent) -> Dict[str, Any]:
+    report: Dict[str, Any] = {"memory": list(agent.memory.messages)}
+    for _, attr in _agent_sections(agent):
+        report[attr] = getattr(agent, attr)
+    return report
+
+
+# Module-level assembly buffer for the TTY report, reused across calls
+# so repeated dumps don't re-pay the growth allocations.
+_REPORT_BUF = bytearray()
 
 
-def main():
-    global entrepreneur, developer, tester, researcher, custom_specialist, peer_reviewer
-    entrepreneur = EntrepreneurAgent("EntrepreneurAI", "AI-powered personal finance app")
+def display_agent_data(*agents: BaseAgent) -> None:
+    if not _PRETTY:
+        # Piped output gets the whole report as one JSON document: a
+        # single recursive encode amortizes the per-section dispatch and
+        # keeps the stream machine-readable for log aggregators.
+        report = {agent.name: _agent_report(agent) for agent in agents}
+        sys.stdout.write(_dumps(report))
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+        return
+
+    # Assemble the whole report in memory and emit it with one write:
+    # per-line print() calls cost one write() syscall each on a TTY.
+    # Encoding stays sequential -- the encoders hold the GIL while
+    # traversing Python objects, so threads would only add pool
+    # overhead to a once-per-run dump.
+    def _encode_agent(agent: BaseAgent) -> bytes:
+        formatter = _FORMATTERS.get(type(agent))
+        if formatter is not None:
+            return formatter(agent)
+        # Generic path for agent subclasses with no generated formatter.
+        parts = [agent._memory_label, _dumps(list(agent.memory.messages)), "\n"]
+        for header, attr in _agent_sections(agent):
+            parts.append(header)
+            parts.append(agent._cached_json(attr))
+            parts.append("\n")
+        parts.append("\n\n")
+        return "".join(parts).encode()
+
+    sections = [_encode_agent(agent) for agent in agents]
+
+    # Splice the sections into the shared assembly buffer rather than a
+    # second join: bytearray grows geometrically, so this is O(log N)
+    # allocations, and the kernel gets one contiguous block to write.
+    # The local alias matters: augmenting the module name directly would
+    # make it function-local and unbound at the clear() above.
+    buf = _REPORT_BUF
+    buf.clear()
+    for section in sections:
+        buf += section
+    sys.stdout.buffer.write(buf)
+    sys.stdout.buffer.flush()
+
+
+@dataclass(slots=True, frozen=True)
+class Agents:
+    """The team roster, passed around instead of module globals."""
+
+    entrepreneur: EntrepreneurAgent
+    developer: DeveloperAgent
+    tester: TesterAgent
+    researcher: ResearchAgent
+    custom_specialist: CustomSpecialistAgent
+    peer_reviewer: PeerReviewAgent
+
+    def __iter__(self):
+        return (getattr(self, field.name) for field in fields(self))
+
+
+def build_agents() -> Agents:
     developer = DeveloperAgent("DeveloperAI")
-    tester = TesterAgent("TesterAI")
-    researcher = ResearchAgent("ResearchAI")
-    custom_specialist = CustomSpecialistAgent("CustomSpecialistAI", "Financial Analysis")
-    peer_reviewer = PeerReviewAgent("PeerReviewerAI")
-
-    agents = [entrepreneur, developer, tester, researcher, custom_specialist, peer_reviewer]
+    return Agents(
+        entrepreneur=EntrepreneurAgent("EntrepreneurAI", "AI-powered personal finance app"),
+        developer=developer,
+        tester=TesterAgent("TesterAI", developer),
+        researcher=ResearchAgent("ResearchAI"),
+        custom_specialist=CustomSpecialistAgent("CustomSpecialistAI", "Financial Analysis"),
+        peer_reviewer=PeerReviewAgent("PeerReviewerAI"),
+    )
+
+
+async def _amain() -> Agents:
+    # agent.run is I/O-bound (HTTP to the Ollama server with negligible
+    # Python work in between), so agents run as coroutines on one event
+    # loop rather than as threads serialized by the GIL or as processes.
+    state = build_agents()
+    agents = list(state)
+    try:
+        await run_all(agents, max_iterations=10)
+        for agent in agents:
+            logger.info("%s has completed its run.", agent.name)
+    except Exception as e:
+        logger.error("Agent run generated an exception: %s", e)
+    return state
 
-    with ThreadPoolExecutor(max_workers=len(agents)) as executor:
-        futures = {executor.submit(agent.run, max_iterations=10): agent for agent in agents}
-        for future in as_completed(futures):
-            agent = futures[future]
-            try:
-                future.result()
-                logger.info(f"{agent.name} has completed its run.")
-            except Exception as e:
-                logger.error(f"{agent.name} generated an exception: {e}")
 
-    display_agent_data(entrepreneur, developer, tester, researcher, custom_specialist, peer_reviewer)
+def main():
+    state = asyncio.run(_amain())
+    display_agent_data(*state)
 
 
 if __name__ == "__main__":